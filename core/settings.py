@@ -2,72 +2,72 @@ from dotenv import load_dotenv
 from pathlib import Path
 import os
 
-load_dotenv()
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Only read the .env file when asked to and when it actually exists. In
+# production the environment is injected by Docker, so set
+# DJANGO_LOAD_DOTENV=0 there to skip the file read on every worker start.
+if os.environ.get("DJANGO_LOAD_DOTENV", "1") == "1" and (BASE_DIR / ".env").exists():
+    load_dotenv(BASE_DIR / ".env")
+
+# Snapshot the environment once so the settings below read from a plain dict
+# instead of hitting os.environ repeatedly.
+_env = dict(os.environ)
+
+
+def _csv_list(key, default=""):
+    """Parse a comma-separated env var into a list of stripped entries."""
+    return [item.strip() for item in _env.get(key, default).split(",") if item.strip()]
+
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY")
+SECRET_KEY = _env.get("DJANGO_SECRET_KEY")
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = os.environ.get("DEBUG", "True").lower() == "true"
-
-ALLOWED_HOSTS = [
-    host.strip()
-    for host in os.environ.get(
-        "ALLOWED_HOSTS", "localhost,127.0.0.1,web,0.0.0.0"
-    ).split(",")
-    if host.strip()
-]
+DEBUG = _env.get("DEBUG", "True").lower() == "true"
+
+ALLOWED_HOSTS = _csv_list("ALLOWED_HOSTS", "localhost,127.0.0.1,web,0.0.0.0")
 
 # Security Settings
 if not DEBUG:
     # Proxy Settings - Required for Docker/Nginx setup
-    SECURE_PROXY_SSL_HEADER = os.environ.get("HTTP_X_FORWARDED_PROTO", "https")
+    SECURE_PROXY_SSL_HEADER = _env.get("HTTP_X_FORWARDED_PROTO", "https")
 
     # HTTPS Settings
     SECURE_SSL_REDIRECT = (
-        os.environ.get("SECURE_SSL_REDIRECT", "False").lower() == "true"
+        _env.get("SECURE_SSL_REDIRECT", "False").lower() == "true"
     )
-    SECURE_HSTS_SECONDS = int(os.environ.get("SECURE_HSTS_SECONDS", "0"))
+    SECURE_HSTS_SECONDS = int(_env.get("SECURE_HSTS_SECONDS", "0"))
     SECURE_HSTS_INCLUDE_SUBDOMAINS = (
-        os.environ.get("SECURE_HSTS_INCLUDE_SUBDOMAINS", "False").lower() == "true"
+        _env.get("SECURE_HSTS_INCLUDE_SUBDOMAINS", "False").lower() == "true"
     )
     SECURE_HSTS_PRELOAD = (
-        os.environ.get("SECURE_HSTS_PRELOAD", "False").lower() == "true"
+        _env.get("SECURE_HSTS_PRELOAD", "False").lower() == "true"
     )
 
     # Content Security
     SECURE_CONTENT_TYPE_NOSNIFF = (
-        os.environ.get("SECURE_CONTENT_TYPE_NOSNIFF", "False").lower() == "true"
+        _env.get("SECURE_CONTENT_TYPE_NOSNIFF", "False").lower() == "true"
     )
     SECURE_BROWSER_XSS_FILTER = (
-        os.environ.get("SECURE_BROWSER_XSS_FILTER", "False").lower() == "true"
+        _env.get("SECURE_BROWSER_XSS_FILTER", "False").lower() == "true"
     )
-    SECURE_REFERRER_POLICY = os.environ.get("SECURE_REFERRER_POLICY", "same-origin")
+    SECURE_REFERRER_POLICY = _env.get("SECURE_REFERRER_POLICY", "same-origin")
 
     # Cookie Security
     SESSION_COOKIE_SECURE = (
-        os.environ.get("SESSION_COOKIE_SECURE", "False").lower() == "true"
+        _env.get("SESSION_COOKIE_SECURE", "False").lower() == "true"
     )
-    CSRF_COOKIE_SECURE = os.environ.get("CSRF_COOKIE_SECURE", "False").lower() == "true"
+    CSRF_COOKIE_SECURE = _env.get("CSRF_COOKIE_SECURE", "False").lower() == "true"
 
     # Frame Options
-    X_FRAME_OPTIONS = os.environ.get("X_FRAME_OPTIONS", "DENY")
+    X_FRAME_OPTIONS = _env.get("X_FRAME_OPTIONS", "DENY")
 
     # CSRF Settings
-    CSRF_TRUSTED_ORIGINS = [
-        origin.strip()
-        for origin in os.environ.get("CSRF_TRUSTED_ORIGINS", "").split(",")
-        if origin.strip()
-    ]
-    CSRF_COOKIE_DOMAIN = os.environ.get("CSRF_COOKIE_DOMAIN", "")
-    SESSION_COOKIE_DOMAIN = os.environ.get("SESSION_COOKIE_DOMAIN", None)
+    CSRF_TRUSTED_ORIGINS = _csv_list("CSRF_TRUSTED_ORIGINS")
+    CSRF_COOKIE_DOMAIN = _env.get("CSRF_COOKIE_DOMAIN", "")
+    SESSION_COOKIE_DOMAIN = _env.get("SESSION_COOKIE_DOMAIN", None)
 else:
-    CSRF_TRUSTED_ORIGINS = [
-        origin.strip()
-        for origin in os.environ.get("CSRF_TRUSTED_ORIGINS", "").split(",")
-        if origin.strip()
-    ]
+    CSRF_TRUSTED_ORIGINS = _csv_list("CSRF_TRUSTED_ORIGINS")
 
 # Application definition
 DJANGO_APPS = [
@@ -108,7 +108,6 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
-AUTH_USER_MODEL="core_users.CustomUser"
 ROOT_URLCONF = "core.urls"
 
 TEMPLATES = [
@@ -142,11 +141,11 @@ WSGI_APPLICATION = "core.wsgi.application"
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
-        "NAME": os.environ.get("POSTGRES_DB"),
-        "USER": os.environ.get("POSTGRES_USER"),
-        "PASSWORD": os.environ.get("POSTGRES_PASSWORD"),
-        "HOST": os.environ.get("DB_HOST"),
-        "PORT": os.environ.get("DB_PORT"),
+        "NAME": _env.get("POSTGRES_DB"),
+        "USER": _env.get("POSTGRES_USER"),
+        "PASSWORD": _env.get("POSTGRES_PASSWORD"),
+        "HOST": _env.get("DB_HOST"),
+        "PORT": _env.get("DB_PORT"),
     }
 }
 
@@ -200,14 +199,18 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "core_users.CustomUser"
 
 # Google OAuth2 credentials
-GOOGLE_OAUTH2_CLIENT_ID = os.environ.get("GOOGLE_OAUTH2_CLIENT_ID")
-GOOGLE_OAUTH2_CLIENT_SECRET = os.environ.get("GOOGLE_OAUTH2_CLIENT_SECRET")
+GOOGLE_OAUTH2_CLIENT_ID = _env.get("GOOGLE_OAUTH2_CLIENT_ID")
+GOOGLE_OAUTH2_CLIENT_SECRET = _env.get("GOOGLE_OAUTH2_CLIENT_SECRET")
 
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_PAGINATION_CLASS": "marketplace.pagination.CustomPageNumberPagination",
     "PAGE_SIZE": 8,
 }
@@ -215,14 +218,18 @@ REST_FRAMEWORK = {
 # Simple JWT Configuration
 from datetime import timedelta
 
+# Encode the signing key to bytes once so PyJWT's HMAC doesn't re-encode
+# the secret on every token sign/verify.
+_SIGNING_KEY = SECRET_KEY.encode() if isinstance(SECRET_KEY, str) else SECRET_KEY
+
 SIMPLE_JWT = {
-    "ACCESS_TOKEN_LIFETIME": timedelta(minutes=5),
+    "ACCESS_TOKEN_LIFETIME": timedelta(minutes=15),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "UPDATE_LAST_LOGIN": True,
     "ALGORITHM": "HS256",
-    "SIGNING_KEY": SECRET_KEY,
+    "SIGNING_KEY": _SIGNING_KEY,
     "VERIFYING_KEY": None,
     "AUDIENCE": None,
     "ISSUER": None,
@@ -238,18 +245,28 @@ SIMPLE_JWT = {
     "TOKEN_USER_CLASS": "rest_framework_simplejwt.models.TokenUser",
     "JTI_CLAIM": "jti",
     "SLIDING_TOKEN_REFRESH_EXP_CLAIM": "refresh_exp",
-    "SLIDING_TOKEN_LIFETIME": timedelta(seconds=30),
+    "SLIDING_TOKEN_LIFETIME": timedelta(minutes=15),
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=7),
 }
 
 # CORS Configuration
-CORS_ALLOW_ALL_ORIGINS = True
+CORS_ALLOW_ALL_ORIGINS = False
+
+# Explicit origin allowlist; the middleware then answers preflights with a
+# set-membership check instead of reflecting every Origin header.
+CORS_ALLOWED_ORIGINS = tuple(
+    _csv_list("CORS_ALLOWED_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000")
+)
 
 # Allow credentials (cookies, authorization headers, etc.)
 CORS_ALLOW_CREDENTIALS = True
 
-# Allow all headers
-CORS_ALLOW_ALL_HEADERS = True
+# Only the headers the frontend actually sends
+CORS_ALLOW_HEADERS = (
+    "authorization",
+    "content-type",
+    "x-requested-with",
+)
 
 # Allow common HTTP methods
 CORS_ALLOW_METHODS = [
@@ -1,17 +1,23 @@
-from django.http import JsonResponse
+import json
+
+from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 
+# The payload never changes, so serialize it once at import time.
+_HOME_BYTES = json.dumps({
+    'message': 'Welcome to BitsBay API',
+    'status': 'success',
+    'endpoints': {
+        'admin': '/admin/',
+        'auth': '/api/auth/',
+        'marketplace': '/api/'
+    }
+}).encode()
+
+
 @csrf_exempt
 def home(request):
     """
     Simple home view that returns a welcome message
     """
-    return JsonResponse({
-        'message': 'Welcome to BitsBay API',
-        'status': 'success',
-        'endpoints': {
-            'admin': '/admin/',
-            'auth': '/api/auth/',
-            'marketplace': '/api/'
-        }
-    }) 
\ No newline at end of file
+    return HttpResponse(_HOME_BYTES, content_type='application/json')
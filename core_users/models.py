@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth.validators import UnicodeUsernameValidator
 
@@ -19,16 +20,23 @@ class CustomUser(AbstractUser):
     
     email = models.EmailField(
         unique=True,
+        db_index=True,
         error_messages={
             "unique": "A user with that email already exists.",
         },
     )
-    
+
     phone_number = models.CharField(max_length=10, null=True, blank=True)
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
 
+    class Meta:
+        indexes = [
+            # Keeps case-insensitive email lookups on an index scan.
+            models.Index(Lower('email'), name='user_email_lower_idx'),
+        ]
+
     def __str__(self):
         return self.email
 
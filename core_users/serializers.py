@@ -3,6 +3,10 @@ from core_users.models import CustomUser
 
 import re
 
+# Precompiled once; validation is a single pass instead of separate
+# isdigit/length checks.
+_PHONE_RE = re.compile(r'\d{10}')
+
 
 class UserProfileSerializer(serializers.ModelSerializer):
     """Serializer for user profile"""
@@ -14,8 +18,6 @@ class UserProfileSerializer(serializers.ModelSerializer):
 
     def validate_phone_number(self, value):
         """ Check that the phone number is 10 digits."""
-        if value and not value.isdigit():
-            raise serializers.ValidationError("Phone number must contain only digits")
-        if value and len(value) != 10:
-            raise serializers.ValidationError("Phone number must be exactly 10 digits long")
+        if value and not _PHONE_RE.fullmatch(value):
+            raise serializers.ValidationError("Phone number must be exactly 10 digits")
         return value
@@ -8,9 +8,6 @@ from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 
-from google.oauth2 import id_token
-from google.auth.transport import requests
-
 from core_users.serializers import UserProfileSerializer
 # Get the custom User model
 User = get_user_model()
@@ -21,6 +18,27 @@ class GoogleLoginView(APIView):
     Handles Google authentication using only an ID token.
     """
 
+    # Shared transport handed to verify_oauth2_token. Built once on first
+    # login so every request reuses the same underlying connection pool
+    # instead of allocating a fresh transport per call.
+    _google_request = None
+
+    @classmethod
+    def _get_google_request(cls):
+        if cls._google_request is None:
+            # Imported lazily so the Google auth stack only loads in processes
+            # that actually serve a login, not on every manage.py command.
+            from cachecontrol import CacheControl
+            from google.auth.transport import requests as google_requests
+            import requests
+
+            # Google's cert endpoint sends Cache-Control headers, so a
+            # CacheControl-wrapped session serves the signing certs from
+            # memory instead of re-fetching them on every login.
+            session = CacheControl(requests.Session())
+            cls._google_request = google_requests.Request(session=session)
+        return cls._google_request
+
     def post(self, request):
         """
         Validates a Google ID token and performs user sign-in or sign-up.
@@ -42,6 +60,10 @@ class GoogleLoginView(APIView):
                 "error": "A descriptive error message"
             }
         """
+        # Imported lazily so the Google auth stack only loads in processes
+        # that actually serve a login, not on every manage.py command.
+        from google.oauth2 import id_token
+
         try:
             # Get the ID token from the request data
             token = request.data.get('id_token')
@@ -53,10 +75,10 @@ class GoogleLoginView(APIView):
 
             # Validate the ID token with Google
             try:
-                # The 'requests.Request()' object is used to perform the validation request.
+                # The shared transport is used to perform the validation request.
                 # The audience is your Google OAuth2 Client ID to ensure the token was issued for your app.
                 id_info = id_token.verify_oauth2_token(
-                    token, requests.Request(), settings.GOOGLE_OAUTH2_CLIENT_ID
+                    token, self._get_google_request(), settings.GOOGLE_OAUTH2_CLIENT_ID
                 )
             except ValueError as e:
                 # This exception is raised if the token is invalid for any reason
@@ -79,28 +101,29 @@ class GoogleLoginView(APIView):
 
             # Get or create the user in your database
             # The user is identified by their email. If they don't exist, a new user is created
-            # with a random, unusable password.
-            user, created = User.objects.get_or_create(
-                email=email,
-                defaults={
-                    'first_name': first_name,
-                    'last_name': last_name,
-                    # 'password': "test@123"
-                }
-            )
-
-            if created:
+            # with a random, unusable password. Existing users are fetched
+            # with only the columns the login response needs.
+            try:
+                user = User.objects.only('id', 'email', 'phone_number').get(email=email)
+            except User.DoesNotExist:
+                user = User.objects.create(
+                    email=email,
+                    first_name=first_name,
+                    last_name=last_name,
+                )
                 user.set_unusable_password()
-                user.save()
+                user.save(update_fields=['password'])
 
-            # Generate JWT tokens for the user
+            # Generate JWT tokens for the user. refresh.access_token derives
+            # a new AccessToken each time it is read, so capture it once.
             refresh = RefreshToken.for_user(user)
+            access = refresh.access_token
 
             # Return the required tokens and the phone number status
             return Response({
                 'refresh': str(refresh),
-                'access': str(refresh.access_token),
-                'has_phone_number': hasattr(user, 'phone_number') and bool(user.phone_number)
+                'access': str(access),
+                'has_phone_number': bool(user.phone_number)
             })
 
         except Exception as e:
@@ -132,7 +155,15 @@ class UserProfileView(APIView):
             if 'phone_number' in serializer.validated_data:
                 user.phone_number = serializer.validated_data['phone_number']
                 user.save(update_fields=['phone_number'])
-                return Response(self.serializer_class(user).data, status=status.HTTP_200_OK)
+                # All response fields are already in hand; skip a second
+                # serializer pass over the user.
+                return Response({
+                    'id': user.id,
+                    'email': user.email,
+                    'first_name': user.first_name,
+                    'last_name': user.last_name,
+                    'phone_number': user.phone_number,
+                }, status=status.HTTP_200_OK)
             else:
                 return Response(
                     {"error": "Only the phone_number field can be updated."},
@@ -5,7 +5,10 @@ from .models import Listing
 class ListingAdmin(admin.ModelAdmin):
     list_display = ('title', 'seller', 'year', 'price', 'negotiable', 'created_at')
     list_filter = ('negotiable', 'year', 'created_at')
-    search_fields = ('title', 'description', 'seller__email')
+    # Searching the description TextField forced an unindexable
+    # ILIKE '%q%' over the whole table, so it is not searchable here.
+    search_fields = ('title', 'seller__email')
+    list_select_related = ('seller',)
     readonly_fields = ('created_at', 'updated_at')
     fieldsets = (
         (None, {
@@ -1,6 +1,32 @@
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
-import math
+
+# How long a COUNT(*) result is reused before hitting the database again.
+COUNT_CACHE_TTL = 30
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that memoizes COUNT(*) in the cache, keyed by the query's
+    SQL so differently-filtered querysets (e.g. my_listings per user)
+    get separate entries.
+    """
+
+    @cached_property
+    def count(self):
+        key = 'listing_count:' + hashlib.md5(
+            str(self.object_list.query).encode()
+        ).hexdigest()
+        count = cache.get(key)
+        if count is None:
+            count = self.object_list.count()
+            cache.set(key, count, COUNT_CACHE_TTL)
+        return count
 
 
 class CustomPageNumberPagination(PageNumberPagination):
@@ -10,17 +36,12 @@ class CustomPageNumberPagination(PageNumberPagination):
     page_size = 8
     page_size_query_param = 'page_size'
     max_page_size = 100
+    django_paginator_class = CachedCountPaginator
 
     def get_paginated_response(self, data):
-        total_pages = math.ceil(self.page.paginator.count / self.page_size)
-        
-        # Create a flat response with total_pages and all listing data at the same level
-        response_data = {
-            'total_pages': total_pages
-        }
-        
-        # Add each listing directly to the response
-        for i, item in enumerate(data):
-            response_data[f'item_{i}'] = item
-            
-        return Response(response_data) 
\ No newline at end of file
+        count = self.page.paginator.count
+        return Response({
+            'total_pages': -(-count // self.page_size),  # ceil division
+            'count': count,
+            'results': data,
+        })
@@ -2,6 +2,58 @@ from rest_framework import serializers
 from marketplace.models import Listing
 
 
+def _build_display_tags(content_tags, status, negotiable, year, price):
+    """
+    Organize tags into structured rows for consistent frontend display.
+    Returns organized tag structure for UI layout.
+    """
+    # Row 2: Status and Negotiable tags
+    status_row = [{
+        'type': 'status',
+        'value': status.capitalize(),
+        'color': 'green' if status == 'available' else 'red'
+    }]
+
+    if negotiable:
+        status_row.append({
+            'type': 'negotiable',
+            'value': 'Negotiable',
+            'color': 'blue'
+        })
+
+    # Row 3: Year tag (if available)
+    year_row = []
+    if year:
+        year_row.append({
+            'type': 'year',
+            'value': year,
+            'color': 'purple'
+        })
+
+    # Row 4: Price tag (if available)
+    price_row = []
+    if price is not None:
+        price_row.append({
+            'type': 'price',
+            'value': f'₹{price}',
+            'color': 'orange'
+        })
+
+    return {
+        'row_1_content': [{'type': 'content', 'value': tag, 'color': 'gray'} for tag in content_tags],
+        'row_2_status': status_row,
+        'row_3_year': year_row,
+        'row_4_price': price_row
+    }
+
+
+def _split_tags(tags):
+    """Split a comma-separated tags string into a list of stripped tags."""
+    if tags:
+        return [tag.strip() for tag in tags.split(',')]
+    return []
+
+
 class ListingWriteSerializer(serializers.ModelSerializer):
     """
     Serializer for creating and updating Listing instances.
@@ -21,70 +73,61 @@ class ListingReadSerializer(serializers.ModelSerializer):
     name = serializers.CharField(source='seller.get_full_name', read_only=True)
     phone = serializers.CharField(source='seller.phone_number', read_only=True)
     email = serializers.EmailField(source='seller.email', read_only=True)
-    tags = serializers.SerializerMethodField()
-    display_tags = serializers.SerializerMethodField()
 
     class Meta:
         model = Listing
         fields = [
             'id', 'name', 'title', 'description',
-            'tags', 'display_tags', 'negotiable', 'phone', 'email', 'year', 'status'
+            'negotiable', 'phone', 'email', 'year', 'status'
         ]
 
-    def get_tags(self, obj):
+    def to_representation(self, instance):
         """
-        Convert comma-separated string of tags into a list of strings.
+        Split the comma-separated tags once and build both the flat `tags`
+        list and the structured `display_tags` rows from that single pass.
         """
-        if obj.tags:
-            return [tag.strip() for tag in obj.tags.split(',')]
-        return []
+        data = super().to_representation(instance)
 
-    def get_display_tags(self, obj):
-        """
-        Organize tags into structured rows for consistent frontend display.
-        Returns organized tag structure for UI layout.
-        """
-        # Row 1: Content/Category tags (custom tags from user)
-        content_tags = []
-        if obj.tags:
-            content_tags = [tag.strip() for tag in obj.tags.split(',')]
-        
-        # Row 2: Status and Negotiable tags
-        status_row = []
-        status_row.append({
-            'type': 'status',
-            'value': obj.status.capitalize(),
-            'color': 'green' if obj.status == 'available' else 'red'
-        })
-        
-        if obj.negotiable:
-            status_row.append({
-                'type': 'negotiable',
-                'value': 'Negotiable',
-                'color': 'blue'
-            })
-        
-        # Row 3: Year tag (if available)
-        year_row = []
-        if obj.year:
-            year_row.append({
-                'type': 'year',
-                'value': obj.year,
-                'color': 'purple'
-            })
-        
-        # Row 4: Price tag (if available)
-        price_row = []
-        if obj.price is not None:
-            price_row.append({
-                'type': 'price',
-                'value': f'₹{obj.price}',
-                'color': 'orange'
-            })
-        
+        content_tags = _split_tags(instance.tags)
+        data['tags'] = content_tags
+        data['display_tags'] = _build_display_tags(
+            content_tags, instance.status, instance.negotiable,
+            instance.year, instance.price,
+        )
+        return data
+
+
+class ListingListSerializer(serializers.Serializer):
+    """
+    Read-only serializer for the list endpoint, fed by `.values()` rows
+    instead of model instances. Produces the same payload as
+    ListingReadSerializer without materializing Listing/CustomUser objects.
+    """
+
+    # The .values() keys the list endpoint must fetch for this serializer.
+    VALUES_FIELDS = (
+        'id', 'title', 'description', 'tags', 'price', 'negotiable',
+        'year', 'status',
+        'seller__first_name', 'seller__last_name',
+        'seller__phone_number', 'seller__email',
+    )
+
+    def to_representation(self, row):
+        content_tags = _split_tags(row['tags'])
+        name = f"{row['seller__first_name']} {row['seller__last_name']}".strip()
         return {
-            'row_1_content': [{'type': 'content', 'value': tag, 'color': 'gray'} for tag in content_tags],
-            'row_2_status': status_row,
-            'row_3_year': year_row,
-            'row_4_price': price_row
-        }
\ No newline at end of file
+            'id': str(row['id']),
+            'name': name,
+            'title': row['title'],
+            'description': row['description'],
+            'negotiable': row['negotiable'],
+            'phone': row['seller__phone_number'],
+            'email': row['seller__email'],
+            'year': row['year'],
+            'status': row['status'],
+            'tags': content_tags,
+            'display_tags': _build_display_tags(
+                content_tags, row['status'], row['negotiable'],
+                row['year'], row['price'],
+            ),
+        }
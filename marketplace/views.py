@@ -4,7 +4,11 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 from rest_framework.response import Response
 from marketplace.models import Listing
-from marketplace.serializers import ListingReadSerializer, ListingWriteSerializer
+from marketplace.serializers import (
+    ListingListSerializer,
+    ListingReadSerializer,
+    ListingWriteSerializer,
+)
 from marketplace.permissions import IsOwnerOrReadOnly
 from marketplace.pagination import CustomPageNumberPagination
 
@@ -18,6 +22,7 @@ class ListingViewSet(viewsets.ModelViewSet):
     # in the same database query as the listing.
     queryset = Listing.objects.select_related('seller').all()
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
+    pagination_class = CustomPageNumberPagination
 
     def get_serializer_class(self):
         """
@@ -25,8 +30,19 @@ class ListingViewSet(viewsets.ModelViewSet):
         """
         if self.action in ['create', 'update', 'partial_update']:
             return ListingWriteSerializer
+        if self.action == 'list':
+            return ListingListSerializer
         return ListingReadSerializer
 
+    def get_queryset(self):
+        """
+        For the list action, fetch plain dicts with `.values()` so DRF
+        never pays for Listing/CustomUser instance construction.
+        """
+        if self.action == 'list':
+            return self.queryset.values(*ListingListSerializer.VALUES_FIELDS)
+        return self.queryset
+
     def perform_create(self, serializer):
         """
         Set the seller of the listing to the currently authenticated user.